@@ -1,33 +1,197 @@
+import hashlib
+
 import streamlit as st
-import requests
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import numpy as np
 from datetime import date, timedelta
 from urllib.parse import unquote
 
+# plotly.express and requests are imported lazily inside the views/fetchers
+# that need them, so first load of a view doesn't pay for the others' imports.
+
 # --- Configuration for Simulated NYC Road Traffic Data ---
 LAT_MIN, LAT_MAX = 40.70, 40.80
 LON_MIN, LON_MAX = -74.02, -73.93
 
+def _parse_json(response):
+    """Decodes a response body with orjson when available (3-5x faster than the
+    stdlib decoder for large nested payloads), falling back to response.json().
+    """
+    try:
+        import orjson
+    except ImportError:
+        return response.json()
+    return orjson.loads(response.content)
+
+@st.cache_resource
+def _get_session():
+    """Shared HTTP session: reuses pooled TLS connections across API calls and
+    retries transient gateway errors with backoff. Built lazily on first fetch.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ))
+    return session
+
 # --- Functions for Simulated Road Traffic Analytics ---
 
-def generate_simulated_traffic_data():
-    """Generates a DataFrame of random traffic data for a small area in NYC."""
-    lat_vals = np.linspace(LAT_MIN, LAT_MAX, 15)
-    lon_vals = np.linspace(LON_MIN, LON_MAX, 15)
-    records = []
-    for lat in lat_vals:
-        for lon in lon_vals:
-            records.append({
-                "lat": lat,
-                "lon": lon,
-                "currentSpeed": np.random.uniform(10, 60),
-                "freeFlowSpeed": np.random.uniform(40, 70),
-                "jamFactor": np.random.uniform(0, 10),
-                "confidence": np.random.uniform(0.5, 1)
-            })
-    return pd.DataFrame(records)
+# numba is optional: the vectorized NumPy path below handles the default 15x15
+# grid fine, but for production-sized grids (hundreds per side) a parallel JIT
+# kernel fills all columns without intermediate array allocations.
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Below this many cells the JIT compile/dispatch overhead outweighs the gain.
+_NUMBA_MIN_CELLS = 10_000
+
+if _HAVE_NUMBA:
+    # splitmix64 constants; draws are keyed on (seed, cell index, draw number),
+    # so output is bit-identical for a given seed no matter how prange schedules
+    # cells across threads — the determinism the seed-keyed caches rely on.
+    _SM64_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+    _SM64_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+    _SM64_MIX2 = np.uint64(0x94D049BB133111EB)
+    _UINT64_INV = np.float64(2.0 ** -64)
+
+    @njit(cache=True)
+    def _sm64_uniform(seed, k, draw, low, high):
+        z = (np.uint64(seed) + np.uint64(k) * np.uint64(4) + np.uint64(draw) + np.uint64(1)) * _SM64_GAMMA
+        z = (z ^ (z >> np.uint64(30))) * _SM64_MIX1
+        z = (z ^ (z >> np.uint64(27))) * _SM64_MIX2
+        z = z ^ (z >> np.uint64(31))
+        return low + (high - low) * (np.float64(z) * _UINT64_INV)
+
+    @njit(parallel=True, cache=True)
+    def _fill_traffic_arrays(lat_vals, lon_vals, seed):
+        n_lon = lon_vals.size
+        n = lat_vals.size * n_lon
+        lat = np.empty(n)
+        lon = np.empty(n)
+        current_speed = np.empty(n)
+        free_flow_speed = np.empty(n)
+        jam_factor = np.empty(n)
+        confidence = np.empty(n)
+        for k in prange(n):
+            lat[k] = lat_vals[k // n_lon]
+            lon[k] = lon_vals[k % n_lon]
+            current_speed[k] = _sm64_uniform(seed, k, 0, 10.0, 60.0)
+            free_flow_speed[k] = _sm64_uniform(seed, k, 1, 40.0, 70.0)
+            jam_factor[k] = _sm64_uniform(seed, k, 2, 0.0, 10.0)
+            confidence[k] = _sm64_uniform(seed, k, 3, 0.5, 1.0)
+        return lat, lon, current_speed, free_flow_speed, jam_factor, confidence
+
+@st.cache_data(ttl=3600)
+def generate_simulated_traffic_data(n_side: int = 15, seed: int = 0):
+    """Generates a DataFrame of random traffic data for a small area in NYC.
+
+    Cached so reruns reuse the same DataFrame; the seed keeps the cache key
+    stable. Grids large enough to amortize compilation use the parallel numba
+    kernel when numba is installed; otherwise vectorized NumPy.
+    """
+    lat_vals = np.linspace(LAT_MIN, LAT_MAX, n_side)
+    lon_vals = np.linspace(LON_MIN, LON_MAX, n_side)
+    if _HAVE_NUMBA and n_side * n_side >= _NUMBA_MIN_CELLS:
+        lat, lon, current_speed, free_flow_speed, jam_factor, confidence = (
+            _fill_traffic_arrays(lat_vals, lon_vals, seed))
+        df = pd.DataFrame({
+            "lat": lat,
+            "lon": lon,
+            "currentSpeed": current_speed,
+            "freeFlowSpeed": free_flow_speed,
+            "jamFactor": jam_factor,
+            "confidence": confidence,
+        })
+    else:
+        rng = np.random.default_rng(seed)
+        lat_grid, lon_grid = np.meshgrid(lat_vals, lon_vals, indexing='ij')
+        n = lat_grid.size
+        df = pd.DataFrame({
+            "lat": lat_grid.ravel(),
+            "lon": lon_grid.ravel(),
+            "currentSpeed": rng.uniform(10, 60, n),
+            "freeFlowSpeed": rng.uniform(40, 70, n),
+            "jamFactor": rng.uniform(0, 10, n),
+            "confidence": rng.uniform(0.5, 1.0, n),
+        })
+    # Values never exceed ~100, so float32 keeps full display precision while
+    # halving the Plotly serialization payload and aggregation scan cost.
+    return df.astype({
+        'currentSpeed': 'float32',
+        'freeFlowSpeed': 'float32',
+        'jamFactor': 'float32',
+        'confidence': 'float32',
+    })
+
+@st.cache_resource
+def _build_traffic_map(seed, _df):
+    """Builds the jam-factor map once per seed from a raw Scattermapbox trace.
+
+    Skips Plotly Express's DataFrame inspection; the seed keys the cache while
+    the DataFrame itself (underscore prefix) is passed by reference unhashed.
+    """
+    # No customdata: jamFactor already rides along as marker.color, so the
+    # tooltip needs no extra per-point arrays in the payload.
+    fig = go.Figure(go.Scattermapbox(
+        lat=_df["lat"].values,
+        lon=_df["lon"].values,
+        marker=dict(
+            color=_df["jamFactor"].values,
+            colorscale="OrRd",
+            size=_df["jamFactor"].values * 1.5,
+            sizemode="diameter",
+            colorbar=dict(title="jamFactor"),
+        ),
+        hovertemplate="jamFactor=%{marker.color:.2f}<extra></extra>",
+    ))
+    fig.update_layout(
+        mapbox=dict(style="open-street-map", zoom=12,
+                    center=dict(lat=float(_df["lat"].mean()), lon=float(_df["lon"].mean()))),
+        height=500,
+        title="Higher 'Jam Factor' indicates worse traffic conditions",
+        margin={"r": 0, "t": 40, "l": 0, "b": 0},
+    )
+    return fig
+
+@st.cache_resource
+def _speed_chart_fig(seed, _df):
+    """Builds the speed comparison chart once per seed (same keying as the map)."""
+    order = np.argsort(_df["lat"].values)
+    lat_sorted = _df["lat"].values[order]
+    fig = go.Figure([
+        go.Scatter(x=lat_sorted, y=_df["currentSpeed"].values[order], name="currentSpeed"),
+        go.Scatter(x=lat_sorted, y=_df["freeFlowSpeed"].values[order], name="freeFlowSpeed"),
+    ])
+    fig.update_layout(
+        title="Current Speed vs Free Flow Speed",
+        xaxis_title="Latitude",
+        yaxis_title="Speed (km/h)",
+    )
+    return fig
+
+@st.cache_resource
+def _jam_hist_fig(seed, _df):
+    """Builds the jam-factor histogram once per seed."""
+    counts, edges = np.histogram(_df["jamFactor"].values, bins=20)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    fig = go.Figure(go.Bar(x=centers, y=counts, width=np.diff(edges)))
+    fig.update_layout(
+        title="Distribution of Traffic Jam Factor",
+        xaxis_title="Jam Factor",
+        yaxis_title="count",
+        bargap=0,
+    )
+    return fig
 
 def display_road_traffic_analytics():
     """Displays maps and charts for the simulated road traffic data."""
@@ -38,60 +202,53 @@ def display_road_traffic_analytics():
     st.dataframe(df.head(10))
 
     st.markdown("### Traffic Jam Factor Heatmap")
-    fig_map = px.scatter_mapbox(
-        df,
-        lat="lat",
-        lon="lon",
-        color="jamFactor",
-        size="jamFactor",
-        size_max=15,
-        color_continuous_scale=px.colors.sequential.OrRd,
-        hover_name="currentSpeed",
-        hover_data={"currentSpeed": True, "freeFlowSpeed": True, "jamFactor": True},
-        zoom=12,
-        height=500,
-        title="Higher 'Jam Factor' indicates worse traffic conditions",
-    )
-    fig_map.update_layout(mapbox_style="open-street-map", margin={"r":0, "t":40, "l":0, "b":0})
+    fig_map = _build_traffic_map(0, df)
     st.plotly_chart(fig_map, use_container_width=True)
 
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("### Traffic Speed Analysis")
-        fig_speed = px.line(
-            df.sort_values(by="lat"),
-            x="lat",
-            y=["currentSpeed", "freeFlowSpeed"],
-            title="Current Speed vs Free Flow Speed",
-            labels={"value": "Speed (km/h)", "lat": "Latitude"}
-        )
-        st.plotly_chart(fig_speed, use_container_width=True)
+        st.plotly_chart(_speed_chart_fig(0, df), use_container_width=True)
 
     with col2:
         st.markdown("### Jam Factor Distribution")
-        fig_jam = px.histogram(
-            df,
-            x="jamFactor",
-            nbins=20,
-            title="Distribution of Traffic Jam Factor",
-            labels={"jamFactor": "Jam Factor"}
-        )
-        st.plotly_chart(fig_jam, use_container_width=True)
+        st.plotly_chart(_jam_hist_fig(0, df), use_container_width=True)
 
-    avg_speed = df["currentSpeed"].mean()
-    avg_free_speed = df["freeFlowSpeed"].mean()
-    avg_jam = df["jamFactor"].mean()
-    max_jam = df["jamFactor"].max()
+    stats = df[["currentSpeed", "freeFlowSpeed", "jamFactor"]].agg(["mean", "max"])
 
     st.markdown("### Aggregate Traffic Insights")
-    st.markdown(f"- Average Current Speed: **{avg_speed:.2f} km/h**")
-    st.markdown(f"- Average Free Flow Speed: **{avg_free_speed:.2f} km/h**")
-    st.markdown(f"- Average Jam Factor: **{avg_jam:.2f}**")
-    st.markdown(f"- Maximum Jam Factor: **{max_jam:.2f}**")
+    st.markdown(f"- Average Current Speed: **{stats.at['mean', 'currentSpeed']:.2f} km/h**")
+    st.markdown(f"- Average Free Flow Speed: **{stats.at['mean', 'freeFlowSpeed']:.2f} km/h**")
+    st.markdown(f"- Average Jam Factor: **{stats.at['mean', 'jamFactor']:.2f}**")
+    st.markdown(f"- Maximum Jam Factor: **{stats.at['max', 'jamFactor']:.2f}**")
 
 # --- Functions for Wikipedia Article Traffic Analytics ---
 
+def _canonical_article(title):
+    """Normalizes an article title or pasted URL to one canonical form.
+
+    Handles full wiki URLs, percent-encoding, underscores, and stray
+    whitespace, and applies MediaWiki's first-letter capitalization — so
+    'streamlit', 'Streamlit' and the pasted URL all hit the same cache entry
+    and trigger one API call. Casing beyond the first letter is preserved
+    because per-article pageview titles are otherwise case-sensitive, and only
+    recognizable wiki URLs are split on '/' so titles like 'AC/DC' survive.
+    """
+    if 'en.wikipedia.org/wiki/' in title:
+        title = title.split('/wiki/', 1)[-1]
+    title = ' '.join(unquote(title).replace('_', ' ').split())
+    return title[:1].upper() + title[1:]
+
+@st.cache_data(ttl=6 * 3600, show_spinner=False)
 def fetch_wikipedia_pageviews(article, start_date, end_date):
+    """Fetches daily pageviews for an article. Returns (DataFrame, error_message).
+
+    Cached on (article, start_date, end_date) so repeated queries skip the
+    network round-trip. Only stable outcomes (data, a 404, an empty result) are
+    returned; transient failures like timeouts raise so they are never cached
+    and a retry goes back to the network — use _fetch_pageviews_safe from UI
+    code to get them as error messages instead.
+    """
     headers = {'User-Agent': 'StreamlitApp/1.0 (https://your-app-url.com; your-email@example.com)'}
     start_str = start_date.strftime('%Y%m%d')
     end_str = end_date.strftime('%Y%m%d')
@@ -100,182 +257,297 @@ def fetch_wikipedia_pageviews(article, start_date, end_date):
         f"https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/"
         f"en.wikipedia/all-access/user/{article_formatted}/daily/{start_str}/{end_str}"
     )
+    response = _get_session().get(url, headers=headers, timeout=(3, 10))
+    if response.status_code == 404:
+        return None, f"Article '{article}' not found on Wikipedia."
+    response.raise_for_status()
+    data = _parse_json(response)
+    if 'items' in data:
+        df = pd.DataFrame(data['items'])
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y%m%d00', cache=True, exact=True)
+        df = df.rename(columns={'views': 'pageviews', 'timestamp': 'date'})
+        df['pageviews'] = df['pageviews'].astype('int32')
+        return df[['date', 'pageviews']], None
+    else:
+        return None, None
+
+def _fetch_pageviews_safe(article, start_date, end_date):
+    """Calls the cached fetcher, converting raised errors back into the
+    (df, error_message) shape the display code renders.
+    """
+    import requests
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 404:
-            st.error(f"Article '{article}' not found on Wikipedia.")
-            return None
-        response.raise_for_status()
-        data = response.json()
-        if 'items' in data:
-            df = pd.DataFrame(data['items'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y%m%d00')
-            df = df.rename(columns={'views': 'pageviews', 'timestamp': 'date'})
-            return df[['date', 'pageviews']]
-        else:
-            return None
+        return fetch_wikipedia_pageviews(article, start_date, end_date)
     except requests.RequestException as e:
-        st.error(f"API request failed: {e}")
-        return None
+        return None, f"API request failed: {e}"
     except Exception as e:
-        st.error(f"Error processing data: {e}")
-        return None
+        return None, f"Error processing data: {e}"
+
+def _pageviews_data_key(df):
+    """Stable byte key over the plotted columns, so the figure caches refresh
+    exactly when the underlying (6-hour ttl) fetch cache serves new data.
+    """
+    return df['date'].values.tobytes() + df['pageviews'].values.tobytes()
+
+@st.cache_resource
+def _pageviews_fig(article_title, data_key, _views_df):
+    """Builds the daily-pageviews line chart once per (article, data content)."""
+    import plotly.express as px
+
+    fig = px.line(
+        _views_df,
+        x='date',
+        y='pageviews',
+        title=f"Daily Traffic for '{article_title}'",
+        labels={'pageviews': 'Pageviews', 'date': 'Date'}
+    )
+    fig.update_layout(hovermode="x unified")
+    return fig
+
+@st.cache_resource
+def _pageviews_comparison_fig(article_titles, data_key, _combined_df):
+    """Builds the multi-article comparison chart once per (titles, data content)."""
+    import plotly.express as px
+
+    fig = px.line(
+        _combined_df,
+        x='date',
+        y='pageviews',
+        color='article',
+        title="Daily Traffic Comparison",
+        labels={'pageviews': 'Pageviews', 'date': 'Date', 'article': 'Article'}
+    )
+    fig.update_layout(hovermode="x unified")
+    return fig
+
+def _fetch_pageviews_many(articles, start_date, end_date):
+    """Fetches pageviews for several articles concurrently.
+
+    Returns a list of (article, df, error_message) tuples in input order. The
+    pooled session is shared across worker threads, so N sequential round-trips
+    collapse to roughly the slowest one.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(
+            lambda article: _fetch_pageviews_safe(article, start_date, end_date),
+            articles,
+        ))
+    return [(article, df, err) for article, (df, err) in zip(articles, results)]
 
 def display_wikipedia_analytics():
     st.markdown("## Wikipedia Article Traffic Analytics")
     st.info("Analyze daily pageviews for English Wikipedia articles using the free Wikimedia API.")
-    article_input = st.text_input("Enter Wikipedia Article Title or URL", "Streamlit")
-    today = date.today()
-    last_month = today - timedelta(days=30)
-    col1, col2 = st.columns(2)
-    with col1:
-        start_date = st.date_input("Start Date", last_month, max_value=today)
-    with col2:
-        end_date = st.date_input("End Date", today, max_value=today)
-
-    if st.button("Get Article Analytics"):
-        if not article_input:
-            st.warning("Please enter an article title or URL.")
-            return
-
-        article_title = article_input
-        if "en.wikipedia.org/wiki/" in article_input:
-            article_title = unquote(article_input.split('/')[-1]).replace('_', ' ')
-
-        if start_date > end_date:
-            st.warning("Start date cannot be after end date.")
-            return
-
-        with st.spinner(f"Fetching pageviews for '{article_title}'..."):
-            views_df = fetch_wikipedia_pageviews(article_title, start_date, end_date)
-
-        if views_df is not None and not views_df.empty:
-            st.success(f"Data retrieved for '{article_title}'!")
-            total_views = views_df['pageviews'].sum()
-            avg_views = views_df['pageviews'].mean()
-            max_views_row = views_df.loc[views_df['pageviews'].idxmax()]
-
-            st.markdown("### Key Metrics")
-            kpi1, kpi2, kpi3 = st.columns(3)
-            kpi1.metric("Total Pageviews", f"{total_views:,}")
-            kpi2.metric("Average Daily Views", f"{avg_views:.0f}")
-            kpi3.metric("Peak Views", f"{max_views_row['pageviews']:,}", max_views_row['date'].strftime('%b %d, %Y'))
-
-            st.markdown("### Daily Pageviews Over Time")
-            fig = px.line(
-                views_df,
-                x='date',
-                y='pageviews',
-                title=f"Daily Traffic for '{article_title}'",
-                labels={'pageviews': 'Pageviews', 'date': 'Date'}
-            )
-            fig.update_layout(hovermode="x unified")
-            st.plotly_chart(fig, use_container_width=True)
-
-            with st.expander("Show Raw Data"):
-                st.dataframe(views_df)
-        else:
-            st.error(f"No data available for '{article_title}'.")
+
+    @st.fragment
+    def _article_section():
+        # Fragment: typing in the inputs or clicking the button reruns only
+        # this section, not the whole script.
+        article_input = st.text_input(
+            "Enter Wikipedia Article Title or URL (comma-separate to compare several)",
+            "Streamlit",
+        )
+        today = date.today()
+        last_month = today - timedelta(days=30)
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input("Start Date", last_month, max_value=today)
+        with col2:
+            end_date = st.date_input("End Date", today, max_value=today)
+
+        if st.button("Get Article Analytics"):
+            if not article_input:
+                st.warning("Please enter an article title or URL.")
+                return
+
+            article_titles = list(dict.fromkeys(
+                _canonical_article(part) for part in article_input.split(',') if part.strip()
+            ))
+            if not article_titles:
+                st.warning("Please enter an article title or URL.")
+                return
+
+            if start_date > end_date:
+                st.warning("Start date cannot be after end date.")
+                return
+
+            if len(article_titles) > 1:
+                with st.spinner(f"Fetching pageviews for {len(article_titles)} articles..."):
+                    results = _fetch_pageviews_many(article_titles, start_date, end_date)
+
+                frames = []
+                for title, df, err in results:
+                    if err:
+                        st.error(err)
+                    elif df is not None and not df.empty:
+                        frames.append(df.assign(article=title))
+                if not frames:
+                    st.error("No data available for the requested articles.")
+                    return
+
+                combined_df = pd.concat(frames, ignore_index=True)
+                st.markdown("### Daily Pageviews Over Time")
+                fig = _pageviews_comparison_fig(
+                    tuple(article_titles), _pageviews_data_key(combined_df), combined_df)
+                st.plotly_chart(fig, use_container_width=True)
+
+                with st.expander("Show Raw Data"):
+                    st.dataframe(combined_df)
+                return
+
+            article_title = article_titles[0]
+
+            with st.spinner(f"Fetching pageviews for '{article_title}'..."):
+                views_df, fetch_error = _fetch_pageviews_safe(article_title, start_date, end_date)
+
+            if fetch_error:
+                st.error(fetch_error)
+                return
+
+            if views_df is not None and not views_df.empty:
+                st.success(f"Data retrieved for '{article_title}'!")
+                pageviews = views_df['pageviews'].values
+                total_views = pageviews.sum()
+                avg_views = pageviews.mean()
+                max_views_row = views_df.iloc[int(pageviews.argmax())]
+
+                st.markdown("### Key Metrics")
+                kpi1, kpi2, kpi3 = st.columns(3)
+                kpi1.metric("Total Pageviews", f"{total_views:,}")
+                kpi2.metric("Average Daily Views", f"{avg_views:.0f}")
+                kpi3.metric("Peak Views", f"{max_views_row['pageviews']:,}", max_views_row['date'].strftime('%b %d, %Y'))
+
+                st.markdown("### Daily Pageviews Over Time")
+                fig = _pageviews_fig(article_title, _pageviews_data_key(views_df), views_df)
+                st.plotly_chart(fig, use_container_width=True)
+
+                with st.expander("Show Raw Data"):
+                    st.dataframe(views_df)
+            else:
+                st.error(f"No data available for '{article_title}'.")
+
+    _article_section()
 
 # --- Functions for Website SEO & Traffic Analytics ---
 
-def fetch_website_seo_data(api_key, domain):
+@st.cache_resource
+def _pie_fig(items, title):
+    """Builds a pie chart once per (label, value) tuple — shared by the device
+    and traffic-source breakdowns, whose small dicts double as the cache key.
+    """
+    fig = go.Figure(go.Pie(
+        labels=[label for label, _ in items],
+        values=[value for _, value in items],
+    ))
+    fig.update_layout(title=title)
+    return fig
+
+@st.cache_data(ttl=86400)
+def fetch_website_seo_data(_api_key, api_key_hash, domain):
+    """Fetches SEO/traffic data for a domain and returns the JSON payload.
+
+    Cached for a day on (api_key_hash, domain) so repeat analyses don't consume
+    API quota. The raw key is excluded from hashing (underscore prefix) and only
+    its SHA-256 digest enters the cache key, so the key never lands in
+    Streamlit's cache metadata. Request failures raise so they are never cached
+    — a retry must hit the network, not a day-old error.
+    """
     url = "https://api.seoreviewtools.com/website-traffic-v2"
-    params = {"key": api_key, "domain": domain}
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        st.error(f"API request failed: {e}")
-        return None
+    params = {"key": _api_key, "domain": domain}
+    response = _get_session().get(url, params=params, timeout=(3, 10))
+    response.raise_for_status()
+    return _parse_json(response)
 
 def display_website_seo_analytics():
+    import plotly.express as px
+
     st.markdown("## Website SEO & Traffic Analytics")
     st.info("Provide a free API key from SEO Review Tools and a website domain to get traffic & SEO info.")
 
-    api_key = st.text_input("API Key", type="password")
-    domain = st.text_input("Website Domain (e.g., streamlit.io)")
-
-    if st.button("Get Website Analytics"):
-        if not api_key or not domain:
-            st.warning("API key and domain are required.")
-            return
-
-        with st.spinner(f"Analyzing {domain}..."):
-            data = fetch_website_seo_data(api_key, domain)
-
-        if data and data.get('success', False):
-            st.success(f"Data retrieved for {domain}!")
-
-            metrics = data.get('data', {})
-
-            st.markdown("### Key Metrics & Engagement")
-            kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-            kpi1.metric("Global Rank", f"#{metrics.get('global_rank', 'N/A'):,}")
-            kpi2.metric("Monthly Visits", f"{metrics.get('visits', 0):,}")
-            bounce_rate = metrics.get('bounce_rate')
-            kpi3.metric("Bounce Rate", f"{bounce_rate:.1%}" if bounce_rate is not None else "N/A")
-            duration = metrics.get('avg_session_duration')
-            if duration is not None:
-                mins, secs = divmod(int(duration), 60)
-                kpi4.metric("Avg. Session", f"{mins}m {secs}s")
-            else:
-                kpi4.metric("Avg. Session", "N/A")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("### Traffic by Country")
-                country_data = metrics.get('traffic_country', [])
-                if country_data:
-                    country_df = pd.DataFrame(country_data)
-                    fig_map = px.choropleth(
-                        country_df,
-                        locations="country_code",
-                        color="traffic_percentage",
-                        hover_name="country_name",
-                        color_continuous_scale=px.colors.sequential.Plasma,
-                        title="Top Countries by Traffic"
-                    )
-                    st.plotly_chart(fig_map, use_container_width=True)
+    @st.fragment
+    def _seo_section():
+        # Fragment: widget events here rerun only this section.
+        api_key = st.text_input("API Key", type="password")
+        domain = st.text_input("Website Domain (e.g., streamlit.io)")
+
+        if st.button("Get Website Analytics"):
+            if not api_key or not domain:
+                st.warning("API key and domain are required.")
+                return
+
+            import requests
+            with st.spinner(f"Analyzing {domain}..."):
+                api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+                try:
+                    data = fetch_website_seo_data(api_key, api_key_hash, domain)
+                except requests.RequestException as e:
+                    st.error(f"API request failed: {e}")
+                    data = None
+
+            if data and data.get('success', False):
+                st.success(f"Data retrieved for {domain}!")
+
+                metrics = data.get('data', {})
+
+                st.markdown("### Key Metrics & Engagement")
+                kpi1, kpi2, kpi3, kpi4 = st.columns(4)
+                kpi1.metric("Global Rank", f"#{metrics.get('global_rank', 'N/A'):,}")
+                kpi2.metric("Monthly Visits", f"{metrics.get('visits', 0):,}")
+                bounce_rate = metrics.get('bounce_rate')
+                kpi3.metric("Bounce Rate", f"{bounce_rate:.1%}" if bounce_rate is not None else "N/A")
+                duration = metrics.get('avg_session_duration')
+                if duration is not None:
+                    mins, secs = divmod(int(duration), 60)
+                    kpi4.metric("Avg. Session", f"{mins}m {secs}s")
                 else:
-                    st.info("No geographic data available.")
-
-            with col2:
-                st.markdown("### Traffic by Device")
-                device_data = metrics.get('traffic_device_split', {})
-                if device_data:
-                    device_df = pd.DataFrame(list(device_data.items()), columns=['Device', 'Percentage'])
-                    fig_device_pie = px.pie(
-                        device_df,
-                        values='Percentage',
-                        names='Device',
-                        title="Traffic Distribution by Device"
-                    )
-                    st.plotly_chart(fig_device_pie, use_container_width=True)
+                    kpi4.metric("Avg. Session", "N/A")
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("### Traffic by Country")
+                    country_data = metrics.get('traffic_country', [])
+                    if country_data:
+                        country_df = pd.DataFrame(country_data)
+                        fig_map = px.choropleth(
+                            country_df,
+                            locations="country_code",
+                            color="traffic_percentage",
+                            hover_name="country_name",
+                            color_continuous_scale=px.colors.sequential.Plasma,
+                            title="Top Countries by Traffic"
+                        )
+                        st.plotly_chart(fig_map, use_container_width=True)
+                    else:
+                        st.info("No geographic data available.")
+
+                with col2:
+                    st.markdown("### Traffic by Device")
+                    device_data = metrics.get('traffic_device_split', {})
+                    if device_data:
+                        fig_device_pie = _pie_fig(
+                            tuple(device_data.items()), "Traffic Distribution by Device")
+                        st.plotly_chart(fig_device_pie, use_container_width=True)
+                    else:
+                        st.info("No device data available.")
+
+                st.markdown("### Traffic Sources")
+                sources_data = metrics.get('traffic_sources', {})
+                if sources_data:
+                    fig_sources_pie = _pie_fig(
+                        tuple(sources_data.items()), "Traffic Distribution by Source")
+                    st.plotly_chart(fig_sources_pie, use_container_width=True)
                 else:
-                    st.info("No device data available.")
-
-            st.markdown("### Traffic Sources")
-            sources_data = metrics.get('traffic_sources', {})
-            if sources_data:
-                sources_df = pd.DataFrame(list(sources_data.items()), columns=['Source', 'Percentage'])
-                fig_sources_pie = px.pie(
-                    sources_df,
-                    values='Percentage',
-                    names='Source',
-                    title="Traffic Distribution by Source"
-                )
-                st.plotly_chart(fig_sources_pie, use_container_width=True)
+                    st.info("No traffic source data available.")
+
+                with st.expander("Show Raw API Response"):
+                    st.json(data)
+            elif data:
+                st.error(f"API error: {data.get('message','Unknown error')}")
             else:
-                st.info("No traffic source data available.")
-
-            with st.expander("Show Raw API Response"):
-                st.json(data)
-        elif data:
-            st.error(f"API error: {data.get('message','Unknown error')}")
-        else:
-            st.error("Failed to retrieve data. Check API key and domain.")
+                st.error("Failed to retrieve data. Check API key and domain.")
+
+    _seo_section()
 
 # --- Main App ---
 